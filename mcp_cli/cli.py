@@ -13,17 +13,12 @@ Version: 1.0.0
 """
 
 import click
-import os
 import sys
 import json
 import yaml
-import requests
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
-from jinja2 import Environment, FileSystemLoader
-import subprocess
-import shutil
 
 # Import our template generators
 from .generators import (
@@ -42,7 +37,7 @@ from .utils import (
     run_initial_tests
 )
 
-@dataclass
+@dataclass(slots=True)
 class MCPProjectConfig:
     """Configuration for MCP project generation"""
     project_name: str
@@ -371,14 +366,19 @@ def _load_openapi_spec(spec_path: str) -> Dict[str, Any]:
     """
     try:
         if spec_path.startswith(('http://', 'https://')):
-            # Load from URL
-            response = requests.get(spec_path, timeout=30)
-            response.raise_for_status()
+            # Load from URL; requests is only imported when actually needed
+            import requests
             
-            if spec_path.endswith('.yaml') or spec_path.endswith('.yml'):
-                return yaml.safe_load(response.text)
-            else:
-                return response.json()
+            try:
+                response = requests.get(spec_path, timeout=30)
+                response.raise_for_status()
+                
+                if spec_path.endswith('.yaml') or spec_path.endswith('.yml'):
+                    return yaml.safe_load(response.text)
+                else:
+                    return response.json()
+            except requests.RequestException as e:
+                raise MCPCLIError(f"Failed to load specification from URL: {e}")
         else:
             # Load from file
             spec_file = Path(spec_path)
@@ -391,8 +391,8 @@ def _load_openapi_spec(spec_path: str) -> Dict[str, Any]:
                 else:
                     return json.load(f)
                     
-    except requests.RequestException as e:
-        raise MCPCLIError(f"Failed to load specification from URL: {e}")
+    except MCPCLIError:
+        raise
     except (json.JSONDecodeError, yaml.YAMLError) as e:
         raise MCPCLIError(f"Failed to parse specification: {e}")
     except Exception as e:
@@ -16,13 +16,28 @@ import os
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 import re
+from contextlib import contextmanager, suppress
+from operator import attrgetter
 from urllib.parse import urlparse
 
-@dataclass
+# Patterns used by the case-conversion template filters
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_CAMEL_BOUNDARY_PATTERN = re.compile(r'([a-z0-9])([A-Z])')
+_WORD_PATTERN = re.compile(r'\w+')
+
+# HTTP methods that are exposed as MCP tools
+_TOOL_HTTP_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE', 'PATCH'})
+
+def _package_dir_name(service_name: str) -> str:
+    """Return the generated package directory name for a service"""
+    return f"mcp_{service_name}"
+
+@dataclass(slots=True)
 class GenerationResult:
     """Result of code generation operation"""
     success: bool
@@ -30,7 +45,7 @@ class GenerationResult:
     errors: List[str]
     warnings: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class OpenAPIAnalysis:
     """Analysis result from OpenAPI specification"""
     endpoints: List[Dict[str, Any]]
@@ -72,42 +87,116 @@ class OpenAPIAnalysis:
             "potential_issues": self.potential_issues
         }
 
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache whose I/O failures fall back to compiling the template"""
+    
+    def load_bytecode(self, bucket) -> None:
+        """Load cached bytecode, leaving the bucket empty if the read fails"""
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            pass
+    
+    def dump_bytecode(self, bucket) -> None:
+        """Store compiled bytecode, skipping the cache if the write fails"""
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            # e.g. a full temp filesystem or the cache dir removed mid-run
+            pass
+
 class BaseGenerator:
     """Base class for all generators with common functionality"""
     
+    # Jinja environment shared by every generator instance
+    _shared_env: Optional[Environment] = None
+    
     def __init__(self):
         """Initialize generator with template environment"""
         self.template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.env = self._get_environment(self.template_dir)
+        
+        # Writes queued while a batched_writes() block is active
+        self._pending_writes: Optional[List[Tuple[Path, str]]] = None
+    
+    @classmethod
+    def _get_environment(cls, template_dir: Path) -> Environment:
+        """
+        Get the template environment shared by all generators
+        
+        Compiled templates are cached on the environment, so sharing it lets
+        every generator reuse templates compiled by any other.
+        
+        Args:
+            template_dir: Directory containing the packaged templates
+            
+        Returns:
+            Environment: Shared Jinja environment with custom filters
+        """
+        if BaseGenerator._shared_env is None:
+            # The packaged template set is small and fixed, so keep every
+            # compiled template and skip the per-render mtime check
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                cache_size=-1,
+                auto_reload=False,
+                bytecode_cache=cls._create_bytecode_cache()
+            )
+            
+            # Add custom filters for template processing
+            env.filters['snake_case'] = cls._to_snake_case
+            env.filters['pascal_case'] = cls._to_pascal_case
+            env.filters['kebab_case'] = cls._to_kebab_case
+            
+            BaseGenerator._shared_env = env
+        
+        return BaseGenerator._shared_env
+    
+    @staticmethod
+    def _create_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+        """
+        Create an on-disk cache for compiled template bytecode
+        
+        Later runs load compiled templates from the cache instead of parsing
+        the template sources again. Entries are keyed by the template source
+        checksum, so edited templates are recompiled automatically. The cache
+        is only an optimisation: if the directory is unusable generation runs
+        without a bytecode cache, and failed reads or writes of individual
+        entries fall back to a normal compile.
         
-        # Add custom filters for template processing
-        self.env.filters['snake_case'] = self._to_snake_case
-        self.env.filters['pascal_case'] = self._to_pascal_case
-        self.env.filters['kebab_case'] = self._to_kebab_case
+        Returns:
+            Optional[FileSystemBytecodeCache]: Bytecode cache in the per-user
+            temp directory, or None if that directory is not usable
+        """
+        try:
+            return _BestEffortBytecodeCache(pattern="mcp_cli_%s.cache")
+        except (OSError, RuntimeError):
+            return None
     
-    def _to_snake_case(self, text: str) -> str:
+    @staticmethod
+    def _to_snake_case(text: str) -> str:
         """Convert text to snake_case"""
         # Replace special chars and spaces with underscores
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\s+', '_', text)
+        text = _NON_WORD_PATTERN.sub('', text)
+        text = _WHITESPACE_PATTERN.sub('_', text)
         # Insert underscore before uppercase letters
-        text = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', text)
+        text = _CAMEL_BOUNDARY_PATTERN.sub(r'\1_\2', text)
         return text.lower()
     
-    def _to_pascal_case(self, text: str) -> str:
+    @staticmethod
+    def _to_pascal_case(text: str) -> str:
         """Convert text to PascalCase"""
-        words = re.findall(r'\w+', text)
+        words = _WORD_PATTERN.findall(text)
         return ''.join(word.capitalize() for word in words)
     
-    def _to_kebab_case(self, text: str) -> str:
+    @staticmethod
+    def _to_kebab_case(text: str) -> str:
         """Convert text to kebab-case"""
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\s+', '-', text)
-        text = re.sub(r'([a-z0-9])([A-Z])', r'\1-\2', text)
+        text = _NON_WORD_PATTERN.sub('', text)
+        text = _WHITESPACE_PATTERN.sub('-', text)
+        text = _CAMEL_BOUNDARY_PATTERN.sub(r'\1-\2', text)
         return text.lower()
     
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
@@ -128,17 +217,140 @@ class BaseGenerator:
         """
         Write content to file, creating directories as needed
         
+        Inside a batched_writes() block the write is queued and performed
+        when the block exits.
+        
         Args:
             file_path: Target file path
             content: File content to write
         """
+        if self._pending_writes is not None:
+            self._pending_writes.append((file_path, content))
+            return
+        
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_content(file_path, content)
+    
+    @contextmanager
+    def batched_writes(self, files_created: List[str], create_dirs: bool = True) -> Iterator[None]:
+        """
+        Queue write_file calls and flush them together when the block exits
+        
+        Parent directories are created once per distinct directory rather
+        than once per file, and files are written in the order queued. Paths
+        recorded in files_created during the block are kept only once their
+        file has actually been written.
+        
+        If the block raises, the files queued before the failure are still
+        written, as they would be without batching, and the original
+        exception propagates even if that flush fails as well.
+        
+        Args:
+            files_created: List the caller records generated paths in
+            create_dirs: Create parent directories on flush; pass False when
+                the caller has already created every target directory
+            
+        Example:
+            with self.batched_writes(files_created):
+                self.write_file(path, content)
+                files_created.append(str(path))
+        """
+        if self._pending_writes is not None:
+            # Already batching; the outermost block flushes
+            yield
+            return
+        
+        first_recorded = len(files_created)
+        self._pending_writes = []
+        try:
+            yield
+        except BaseException:
+            with suppress(Exception):
+                self._flush_pending(files_created, first_recorded, create_dirs)
+            raise
+        
+        self._flush_pending(files_created, first_recorded, create_dirs)
+    
+    def _flush_pending(self, files_created: List[str], first_recorded: int,
+                       create_dirs: bool) -> None:
+        """Flush queued writes and drop recorded paths that were not written"""
+        pending, self._pending_writes = self._pending_writes, None
+        written: Set[str] = set()
+        
+        try:
+            self._flush_writes(pending, written, create_dirs)
+        finally:
+            # Only report queued paths whose file actually reached disk
+            queued = {str(file_path) for file_path, _ in pending}
+            files_created[first_recorded:] = [
+                path for path in files_created[first_recorded:]
+                if path not in queued or path in written
+            ]
+    
+    def _flush_writes(self, pending: List[Tuple[Path, str]], written: Set[str],
+                      create_dirs: bool) -> None:
+        """Create each parent directory once, then write every queued file in order"""
+        if create_dirs:
+            for directory in dict.fromkeys(file_path.parent for file_path, _ in pending):
+                directory.mkdir(parents=True, exist_ok=True)
+        
+        for file_path, content in pending:
+            self._write_content(file_path, content)
+            written.add(str(file_path))
+    
+    def _write_content(self, file_path: Path, content: str) -> None:
+        """
+        Write content to a file whose parent directory already exists
+        
+        Files that already hold exactly this content are left untouched, so
+        regenerating a project only rewrites (and re-timestamps) files whose
+        output actually changed.
+        """
+        # Writing pre-encoded bytes skips the text layer entirely and keeps
+        # output identical on every platform (utf-8, no newline translation)
+        data = content.encode('utf-8')
+        
+        try:
+            # Size check first so differing files are rarely read back
+            if file_path.stat().st_size == len(data) and file_path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+        
+        file_path.write_bytes(data)
 
 class ProjectStructureGenerator(BaseGenerator):
     """Generator for basic MCP server project structure"""
     
+    # Leaf directories only; mkdir(parents=True) creates src/ and tests/
+    _LEAF_DIRECTORIES = (
+        "tests/unit",
+        "tests/integration",
+        "tests/fixtures",
+        "config",
+        "scripts",
+        "docs",
+        "docker"
+    )
+    
+    # Config attributes the project templates are rendered from
+    _CONTEXT_FIELDS = (
+        "service_name",
+        "project_name",
+        "description",
+        "author",
+        "version",
+        "python_version",
+        "test_framework"
+    )
+    
+    # Fetches all context fields from a config in a single C-level call
+    _CONTEXT_GETTER = attrgetter(*_CONTEXT_FIELDS)
+    
+    # Fields generation cannot proceed without (package path, project name);
+    # the rest render as-is, e.g. a spec with an empty info.description
+    _REQUIRED_FIELDS = ("service_name", "project_name")
+    
     def generate(self, project_path: Path, config) -> GenerationResult:
         """
         Generate basic project structure and core files
@@ -154,30 +366,35 @@ class ProjectStructureGenerator(BaseGenerator):
         errors = []
         
         try:
+            # Read the config once; every template draws from this context
+            context, missing_fields = self._read_context(config)
+            
+            # Reject incomplete configs before touching the filesystem
+            errors.extend(self._validate_config(context, missing_fields))
+            if errors:
+                return GenerationResult(
+                    success=False,
+                    files_created=files_created,
+                    errors=errors,
+                    warnings=[]
+                )
+            
             # Create directory structure
-            directories = [
-                "src",
-                f"src/mcp_{config.service_name}",
-                "tests/unit",
-                "tests/integration",
-                "tests/fixtures",
-                "config",
-                "scripts",
-                "docs",
-                "docker"
-            ]
+            directories = (f"src/{_package_dir_name(context['service_name'])}",) + self._LEAF_DIRECTORIES
             
             for directory in directories:
                 (project_path / directory).mkdir(parents=True, exist_ok=True)
             
-            # Generate core Python files
-            self._generate_core_files(project_path, config, files_created)
-            
-            # Generate configuration files
-            self._generate_config_files(project_path, config, files_created)
-            
-            # Generate documentation
-            self._generate_docs(project_path, config, files_created)
+            # Every target directory exists now, so the flush only writes files
+            with self.batched_writes(files_created, create_dirs=False):
+                # Generate core Python files
+                self._generate_core_files(project_path, context, files_created)
+                
+                # Generate configuration files
+                self._generate_config_files(project_path, context, files_created)
+                
+                # Generate documentation
+                self._generate_docs(project_path, context, files_created)
             
             return GenerationResult(
                 success=True,
@@ -195,16 +412,61 @@ class ProjectStructureGenerator(BaseGenerator):
                 warnings=[]
             )
     
-    def _generate_core_files(self, project_path: Path, config, files_created: List[str]):
+    def _read_context(self, config) -> Tuple[Dict[str, Any], Set[str]]:
+        """
+        Read the template context fields from a project config
+        
+        Args:
+            config: Project configuration object
+            
+        Returns:
+            Tuple[Dict[str, Any], Set[str]]: Field values (None for missing
+            attributes) and the names of attributes the config lacks
+        """
+        try:
+            values = self._CONTEXT_GETTER(config)
+        except AttributeError:
+            # Incomplete config; fall back so validation can name each field
+            missing_fields = {
+                field for field in self._CONTEXT_FIELDS if not hasattr(config, field)
+            }
+            values = tuple(getattr(config, field, None) for field in self._CONTEXT_FIELDS)
+            return dict(zip(self._CONTEXT_FIELDS, values)), missing_fields
+        
+        return dict(zip(self._CONTEXT_FIELDS, values)), set()
+    
+    def _validate_config(self, context: Dict[str, Any], missing_fields: Set[str]) -> List[str]:
+        """
+        Check that the config provides everything generation depends on
+        
+        Every context field must be present on the config. Only the required
+        fields must also be non-None; other values such as a null
+        description render as they are.
+        
+        Args:
+            context: Template context read from the project config
+            missing_fields: Context fields the config has no attribute for
+            
+        Returns:
+            List[str]: One error per missing field or None required value
+        """
+        return [
+            f"Missing required configuration value: {field}"
+            for field in self._CONTEXT_FIELDS
+            if field in missing_fields
+            or (field in self._REQUIRED_FIELDS and context[field] is None)
+        ]
+    
+    def _generate_core_files(self, project_path: Path, context: Dict[str, Any], files_created: List[str]):
         """Generate core Python module files"""
         
-        service_dir = project_path / "src" / f"mcp_{config.service_name}"
+        service_dir = project_path / "src" / _package_dir_name(context['service_name'])
         
         # Generate __init__.py
         init_content = self.render_template("python/__init__.py.j2", {
-            "service_name": config.service_name,
-            "version": config.version,
-            "description": config.description
+            "service_name": context["service_name"],
+            "version": context["version"],
+            "description": context["description"]
         })
         init_path = service_dir / "__init__.py"
         self.write_file(init_path, init_content)
@@ -212,9 +474,9 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate server.py (main MCP server)
         server_content = self.render_template("python/server.py.j2", {
-            "service_name": config.service_name,
-            "project_name": config.project_name,
-            "description": config.description
+            "service_name": context["service_name"],
+            "project_name": context["project_name"],
+            "description": context["description"]
         })
         server_path = service_dir / "server.py"
         self.write_file(server_path, server_content)
@@ -222,8 +484,8 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate config.py
         config_content = self.render_template("python/config.py.j2", {
-            "service_name": config.service_name,
-            "project_name": config.project_name
+            "service_name": context["service_name"],
+            "project_name": context["project_name"]
         })
         config_path = service_dir / "config.py"
         self.write_file(config_path, config_content)
@@ -231,7 +493,7 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate models.py
         models_content = self.render_template("python/models.py.j2", {
-            "service_name": config.service_name
+            "service_name": context["service_name"]
         })
         models_path = service_dir / "models.py"
         self.write_file(models_path, models_content)
@@ -239,7 +501,7 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate client.py (API client wrapper)
         client_content = self.render_template("python/client.py.j2", {
-            "service_name": config.service_name
+            "service_name": context["service_name"]
         })
         client_path = service_dir / "client.py"
         self.write_file(client_path, client_content)
@@ -247,18 +509,18 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate tools.py (MCP tools)
         tools_content = self.render_template("python/tools.py.j2", {
-            "service_name": config.service_name
+            "service_name": context["service_name"]
         })
         tools_path = service_dir / "tools.py"
         self.write_file(tools_path, tools_content)
         files_created.append(str(tools_path))
     
-    def _generate_config_files(self, project_path: Path, config, files_created: List[str]):
+    def _generate_config_files(self, project_path: Path, context: Dict[str, Any], files_created: List[str]):
         """Generate configuration files"""
         
         # Generate requirements.txt
         requirements_content = self.render_template("config/requirements.txt.j2", {
-            "python_version": config.python_version
+            "python_version": context["python_version"]
         })
         req_path = project_path / "requirements.txt"
         self.write_file(req_path, requirements_content)
@@ -266,7 +528,7 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate requirements-dev.txt
         dev_req_content = self.render_template("config/requirements-dev.txt.j2", {
-            "test_framework": config.test_framework
+            "test_framework": context["test_framework"]
         })
         dev_req_path = project_path / "requirements-dev.txt"
         self.write_file(dev_req_path, dev_req_content)
@@ -274,12 +536,12 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate pyproject.toml
         pyproject_content = self.render_template("config/pyproject.toml.j2", {
-            "project_name": config.project_name,
-            "service_name": config.service_name,
-            "description": config.description,
-            "author": config.author,
-            "version": config.version,
-            "python_version": config.python_version
+            "project_name": context["project_name"],
+            "service_name": context["service_name"],
+            "description": context["description"],
+            "author": context["author"],
+            "version": context["version"],
+            "python_version": context["python_version"]
         })
         pyproject_path = project_path / "pyproject.toml"
         self.write_file(pyproject_path, pyproject_content)
@@ -287,22 +549,22 @@ class ProjectStructureGenerator(BaseGenerator):
         
         # Generate .env.example
         env_content = self.render_template("config/.env.example.j2", {
-            "service_name": config.service_name.upper(),
-            "project_name": config.project_name
+            "service_name": context["service_name"].upper(),
+            "project_name": context["project_name"]
         })
         env_path = project_path / ".env.example"
         self.write_file(env_path, env_content)
         files_created.append(str(env_path))
     
-    def _generate_docs(self, project_path: Path, config, files_created: List[str]):
+    def _generate_docs(self, project_path: Path, context: Dict[str, Any], files_created: List[str]):
         """Generate documentation files"""
         
         # Generate README.md
         readme_content = self.render_template("docs/README.md.j2", {
-            "project_name": config.project_name,
-            "service_name": config.service_name,
-            "description": config.description,
-            "author": config.author
+            "project_name": context["project_name"],
+            "service_name": context["service_name"],
+            "description": context["description"],
+            "author": context["author"]
         })
         readme_path = project_path / "README.md"
         self.write_file(readme_path, readme_content)
@@ -332,10 +594,11 @@ class OpenAPIGenerator(BaseGenerator):
         
         for path, methods in paths.items():
             for method, operation in methods.items():
-                if method.upper() in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH']:
+                method = method.upper()
+                if method in _TOOL_HTTP_METHODS:
                     endpoints.append({
                         'path': path,
-                        'method': method.upper(),
+                        'method': method,
                         'operation_id': operation.get('operationId'),
                         'summary': operation.get('summary'),
                         'description': operation.get('description'),
@@ -479,7 +742,7 @@ class OpenAPIGenerator(BaseGenerator):
     def _generate_openapi_models(self, project_path: Path, config, analysis: OpenAPIAnalysis, files_created: List[str]):
         """Generate Pydantic models from OpenAPI schemas"""
         
-        service_dir = project_path / "src" / f"mcp_{config.service_name}"
+        service_dir = project_path / "src" / _package_dir_name(config.service_name)
         
         models_content = self.render_template("openapi/models.py.j2", {
             "service_name": config.service_name,
@@ -495,7 +758,7 @@ class OpenAPIGenerator(BaseGenerator):
                                 analysis: OpenAPIAnalysis, files_created: List[str]):
         """Generate API client wrapper for OpenAPI endpoints"""
         
-        service_dir = project_path / "src" / f"mcp_{config.service_name}"
+        service_dir = project_path / "src" / _package_dir_name(config.service_name)
         
         # Extract server information
         servers = openapi_data.get('servers', [{'url': 'https://api.example.com'}])
@@ -519,7 +782,7 @@ class OpenAPIGenerator(BaseGenerator):
     def _generate_openapi_tools(self, project_path: Path, config, analysis: OpenAPIAnalysis, files_created: List[str]):
         """Generate MCP tools from OpenAPI endpoints"""
         
-        service_dir = project_path / "src" / f"mcp_{config.service_name}"
+        service_dir = project_path / "src" / _package_dir_name(config.service_name)
         
         tools_content = self.render_template("openapi/tools.py.j2", {
             "service_name": config.service_name,
@@ -534,7 +797,7 @@ class OpenAPIGenerator(BaseGenerator):
     def _generate_openapi_server(self, project_path: Path, config, analysis: OpenAPIAnalysis, files_created: List[str]):
         """Generate main MCP server with OpenAPI integration"""
         
-        service_dir = project_path / "src" / f"mcp_{config.service_name}"
+        service_dir = project_path / "src" / _package_dir_name(config.service_name)
         
         server_content = self.render_template("openapi/server.py.j2", {
             "service_name": config.service_name,
@@ -634,14 +897,15 @@ class TestGenerator(BaseGenerator):
         errors = []
         
         try:
-            # Generate pytest configuration
-            self._generate_pytest_config(project_path, config, files_created)
-            
-            # Generate test fixtures
-            self._generate_test_fixtures(project_path, config, files_created)
-            
-            # Generate basic test cases
-            self._generate_basic_tests(project_path, config, files_created)
+            with self.batched_writes(files_created):
+                # Generate pytest configuration
+                self._generate_pytest_config(project_path, config, files_created)
+                
+                # Generate test fixtures
+                self._generate_test_fixtures(project_path, config, files_created)
+                
+                # Generate basic test cases
+                self._generate_basic_tests(project_path, config, files_created)
             
             return GenerationResult(
                 success=True,
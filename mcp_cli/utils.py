@@ -18,9 +18,6 @@ import subprocess
 import shutil
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
-import tempfile
-import zipfile
-import tarfile
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """
@@ -273,6 +270,9 @@ def extract_archive(archive_path: Path, extract_to: Path) -> bool:
     Example:
         success = extract_archive(Path("./template.zip"), Path("./extracted"))
     """
+    import zipfile
+    import tarfile
+    
     try:
         extract_to.mkdir(parents=True, exist_ok=True)
         
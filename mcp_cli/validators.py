@@ -10,16 +10,18 @@ This module provides comprehensive validation for:
 All validators follow a consistent pattern and provide detailed error reporting.
 """
 
-import json
-import yaml
 import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass
-import importlib.util
-import ast
 
-@dataclass
+# Leading distribution name of a requirements.txt line (before any specifier)
+_REQUIREMENT_NAME_PATTERN = re.compile(r'^[ \t]*([A-Za-z0-9][A-Za-z0-9._-]*)', re.MULTILINE)
+
+# Sections recommended in a generated project's README.md
+_README_SECTION_PATTERN = re.compile(r'installation|usage|configuration', re.IGNORECASE)
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation operation with detailed feedback"""
     is_valid: bool
@@ -34,7 +36,7 @@ class OpenAPIValidator:
         """Initialize OpenAPI validator with required fields and patterns"""
         self.required_root_fields = ['openapi', 'info', 'paths']
         self.required_info_fields = ['title', 'version']
-        self.supported_versions = ['3.0.0', '3.0.1', '3.0.2', '3.0.3', '3.1.0']
+        self.supported_versions = {'3.0.0', '3.0.1', '3.0.2', '3.0.3', '3.1.0'}
         self.http_methods = {'get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'trace'}
     
     def validate(self, openapi_data: Dict[str, Any]) -> ValidationResult:
@@ -107,7 +109,8 @@ class OpenAPIValidator:
     def _validate_version(self, spec: Dict[str, Any], errors: List[str], warnings: List[str]):
         """Validate OpenAPI version"""
         version = spec.get('openapi')
-        if version not in self.supported_versions:
+        # Non-string values (possibly unhashable) are never a supported version
+        if not isinstance(version, str) or version not in self.supported_versions:
             if version:
                 warnings.append(f"OpenAPI version {version} may not be fully supported")
             else:
@@ -383,15 +386,15 @@ class ProjectValidator:
         """Validate requirements.txt file"""
         try:
             with open(req_path, 'r') as f:
-                requirements = f.read().strip().split('\n')
+                content = f.read()
             
             required_packages = ['mcp', 'pydantic', 'httpx']
-            found_packages = set()
             
-            for req in requirements:
-                if req.strip() and not req.strip().startswith('#'):
-                    package_name = req.split('==')[0].split('>=')[0].split('<=')[0].strip()
-                    found_packages.add(package_name.lower())
+            # Single pass over the file; comments and pip options never match
+            found_packages = {
+                match.group(1).lower()
+                for match in _REQUIREMENT_NAME_PATTERN.finditer(content)
+            }
             
             for package in required_packages:
                 if package not in found_packages:
@@ -423,6 +426,8 @@ class ProjectValidator:
     
     def _validate_python_syntax(self, file_path: Path, errors: List[str], warnings: List[str]):
         """Validate Python file syntax and basic structure"""
+        import ast
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -479,11 +484,16 @@ class ProjectValidator:
         if readme_path.exists():
             try:
                 with open(readme_path, 'r', encoding='utf-8') as f:
-                    readme_content = f.read().lower()
+                    readme_content = f.read()
+                
+                # Collect every section keyword in one pass over the README
+                found_sections = {
+                    match.lower() for match in _README_SECTION_PATTERN.findall(readme_content)
+                }
                 
                 required_sections = ['installation', 'usage', 'configuration']
                 for section in required_sections:
-                    if section not in readme_content:
+                    if section not in found_sections:
                         suggestions.append(f"Consider adding {section} section to README.md")
                         
             except Exception as e: